@@ -13,6 +13,7 @@ import yaml
 
 from .rules import get_rule_dir_yaml
 from .utils import read_file_list
+from .yaml import yaml_Loader
 
 
 def find_section_lines(file_contents, sec):
@@ -129,7 +130,7 @@ def parse_from_yaml(file_contents, lines):
 
     new_file_arr = file_contents[lines.start:lines.end + 1]
     new_file = "\n".join(new_file_arr)
-    return yaml.load(new_file, Loader=yaml.Loader)
+    return yaml.load(new_file, Loader=yaml_Loader)
 
 
 def get_yaml_contents(rule_obj):
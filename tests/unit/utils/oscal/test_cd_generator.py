@@ -4,7 +4,7 @@ import pathlib
 import shutil
 from typing import Any, Dict, Generator, Tuple
 from tempfile import TemporaryDirectory
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from trestle.common.common_types import TopLevelOscalModel
@@ -104,6 +104,85 @@ def test_oscal_profile_helper(vendor_dir: str, input: str, response: str) -> Non
     assert result_id == response
 
 
+def test_oscal_profile_helper_cache(vendor_dir: str) -> None:
+    """Test the OSCALProfileHelper class reads the resolved catalog from the cache."""
+    trestle_root = pathlib.Path(vendor_dir)
+    cache_dir = os.path.join(vendor_dir, "cache")
+    profile_path = f"{vendor_dir}/profiles/simplified_nist_profile/profile.json"
+
+    oscal_profile_helper = OSCALProfileHelper(trestle_root, cache_dir=cache_dir)
+    oscal_profile_helper.load(profile_path=profile_path)
+    assert len(os.listdir(cache_dir)) == 1
+
+    cached_profile_helper = OSCALProfileHelper(trestle_root, cache_dir=cache_dir)
+    with patch.object(cached_profile_helper, "_resolve_catalog") as resolve_catalog:
+        cached_profile_helper.load(profile_path=profile_path)
+        resolve_catalog.assert_not_called()
+    assert cached_profile_helper.profile_controls == oscal_profile_helper.profile_controls
+    assert cached_profile_helper.controls_by_label == oscal_profile_helper.controls_by_label
+
+    # Updating the profile invalidates the cached catalog
+    stat = os.stat(profile_path)
+    os.utime(profile_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    touched_profile_helper = OSCALProfileHelper(trestle_root, cache_dir=cache_dir)
+    with patch.object(
+        touched_profile_helper,
+        "_resolve_catalog",
+        wraps=touched_profile_helper._resolve_catalog,
+    ) as resolve_catalog:
+        touched_profile_helper.load(profile_path=profile_path)
+        resolve_catalog.assert_called_once()
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_oscal_profile_helper_cache_corrupt(vendor_dir: str) -> None:
+    """Test the OSCALProfileHelper class replaces a cached catalog that cannot be loaded."""
+    trestle_root = pathlib.Path(vendor_dir)
+    cache_dir = os.path.join(vendor_dir, "cache")
+    profile_path = f"{vendor_dir}/profiles/simplified_nist_profile/profile.json"
+
+    oscal_profile_helper = OSCALProfileHelper(trestle_root, cache_dir=cache_dir)
+    oscal_profile_helper.load(profile_path=profile_path)
+    cache_files = os.listdir(cache_dir)
+    assert len(cache_files) == 1
+    cache_path = os.path.join(cache_dir, cache_files[0])
+    with open(cache_path, "r+b") as f:
+        f.truncate(os.path.getsize(cache_path) // 2)
+
+    recovered_profile_helper = OSCALProfileHelper(trestle_root, cache_dir=cache_dir)
+    recovered_profile_helper.load(profile_path=profile_path)
+    assert recovered_profile_helper.profile_controls == oscal_profile_helper.profile_controls
+    assert os.listdir(cache_dir) == cache_files
+
+    cached_profile_helper = OSCALProfileHelper(trestle_root, cache_dir=cache_dir)
+    with patch.object(cached_profile_helper, "_resolve_catalog") as resolve_catalog:
+        cached_profile_helper.load(profile_path=profile_path)
+        resolve_catalog.assert_not_called()
+
+
+def test_oscal_profile_helper_cache_errors(vendor_dir: str) -> None:
+    """Test the OSCALProfileHelper class resolves the profile when the cache fails."""
+    trestle_root = pathlib.Path(vendor_dir)
+    cache_dir = os.path.join(vendor_dir, "cache")
+    profile_path = f"{vendor_dir}/profiles/simplified_nist_profile/profile.json"
+
+    # A failed write does not stop the load and leaves no temporary files behind
+    oscal_profile_helper = OSCALProfileHelper(trestle_root, cache_dir=cache_dir)
+    with patch("pickle.dump", side_effect=OSError("No space left on device")):
+        oscal_profile_helper.load(profile_path=profile_path)
+    assert oscal_profile_helper.validate("AC-1") == "ac-1"
+    assert os.listdir(cache_dir) == []
+
+    OSCALProfileHelper(trestle_root, cache_dir=cache_dir).load(profile_path=profile_path)
+    assert len(os.listdir(cache_dir)) == 1
+
+    # A cached catalog that fails to load for any reason is resolved again
+    failed_profile_helper = OSCALProfileHelper(trestle_root, cache_dir=cache_dir)
+    with patch("pickle.load", side_effect=ValueError("unsupported pickle protocol")):
+        failed_profile_helper.load(profile_path=profile_path)
+    assert failed_profile_helper.validate("AC-1") == "ac-1"
+
+
 @pytest.mark.parametrize(
     "ssg_status, oscal_status, err_msg",
     [
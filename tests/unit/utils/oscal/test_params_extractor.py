@@ -0,0 +1,18 @@
+import os
+
+from utils.oscal.params_extractor import find_var_files
+
+
+DATADIR = os.path.join(os.path.dirname(__file__), "data")
+TEST_ROOT = os.path.abspath(os.path.join(DATADIR, "test_root"))
+
+
+def test_find_var_files() -> None:
+    """Test finding var files recursively."""
+    var_files = list(find_var_files(TEST_ROOT))
+    assert [os.path.basename(var_file) for var_file in var_files] == ["var_test.var"]
+
+
+def test_find_var_files_missing_directory() -> None:
+    """Test a missing directory yields no var files."""
+    assert list(find_var_files(os.path.join(TEST_ROOT, "missing"))) == []
@@ -1,10 +1,12 @@
 import os
 import pytest
 from typing import Any, Dict, List
+from unittest.mock import patch
 
 from trestle.oscal.common import Property
 
 
+import ssg.build_yaml
 from ssg.environment import open_environment
 from ssg.products import product_yaml_path
 
@@ -106,6 +108,24 @@ def test_rule_transformer_load_with_param(env_yaml: Dict[str, Any]) -> None:
     assert not rule_objs[1].parameters
 
 
+def test_rule_transformer_load_once(env_yaml: Dict[str, Any]) -> None:
+    """Test rules shared by several rulesets are only parsed once."""
+    transformer = RulesTransformer(
+        TEST_ROOT,
+        env_yaml,
+        TEST_RULE_JSON,
+        ParameterExtractor(TEST_ROOT, env_yaml),
+    )
+    with patch.object(
+        ssg.build_yaml.Rule, "from_yaml", wraps=ssg.build_yaml.Rule.from_yaml
+    ) as from_yaml:
+        transformer.add_rules(["rule_1", "rule_2"])
+        transformer.add_rules(["rule_1"])
+        assert from_yaml.call_count == 2
+
+    assert len(transformer.get_all_rules()) == 2
+
+
 def test_rules_transformer_transform(
     test_rule_objs: List[RuleInfo], env_yaml: Dict[str, Any]
 ) -> None:
@@ -150,7 +170,7 @@ def test_rules_transformer_transform(
         "Rule 1 description",
         "var_test",
         "Test parameter",
-        "{'default': 'default', 'alternate': 'alternate'}",
+        '{"alternate":"alternate","default":"default"}',
     ]
     assert sorted(prop_values) == sorted(expected_prop_values)
 
@@ -172,3 +192,34 @@ def test_rules_transformer_transform(
         "Rule 2 description",
     ]
     assert sorted(prop_values) == sorted(expected_prop_values)
+
+
+def test_rules_transformer_transform_rule_set_ids(env_yaml: Dict[str, Any]) -> None:
+    """Test rule set ids are numbered consistently across all rules."""
+    transformer = RulesTransformer(
+        TEST_ROOT,
+        env_yaml,
+        TEST_RULE_JSON,
+        ParameterExtractor(TEST_ROOT, env_yaml),
+    )
+    rule_objs: List[RuleInfo] = list()
+    for i in range(8):
+        rule_obj = RuleInfo(rule_id=f"rule_{i}", rule_dir="rule_dir")
+        rule_obj.add_description(f"Rule {i} description")
+        rule_objs.append(rule_obj)
+
+    props = transformer.transform(rule_objs)
+
+    rulesets = sorted({prop.remarks for prop in props})
+    assert rulesets == [f"rule_set_{i}" for i in range(8)]
+
+
+def test_rules_transformer_transform_no_rules(env_yaml: Dict[str, Any]) -> None:
+    """Test transforming an empty set of rules returns no properties."""
+    transformer = RulesTransformer(
+        TEST_ROOT,
+        env_yaml,
+        TEST_RULE_JSON,
+        ParameterExtractor(TEST_ROOT, env_yaml),
+    )
+    assert transformer.transform([]) == []
@@ -1,7 +1,7 @@
 import os
-from typing import Optional
+from typing import Any, Dict, Optional
 
-import ssg.products
+from ssg.utils import required_key
 
 from trestle.common.const import TRESTLE_GENERIC_NS
 from trestle.core.generators import generate_sample_model
@@ -11,16 +11,15 @@ SSG_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 VENDOR_ROOT = os.path.join(SSG_ROOT, "shared", "references", "oscal")
 RULES_JSON = os.path.join(SSG_ROOT, "build", "rule_dirs.json")
 BUILD_CONFIG = os.path.join(SSG_ROOT, "build", "build_config.yml")
+PROFILE_CACHE_DIR = os.path.join(SSG_ROOT, "build", ".cache", "profiles")
 TRESTLE_CD_NS = f"{TRESTLE_GENERIC_NS}/cd"
 LOGGER_NAME = "oscal"
 
 
-def get_benchmark_root(root: str, product: str) -> str:
-    """Get the benchmark root."""
-    product_yaml_path = ssg.products.product_yaml_path(root, product)
-    product_yaml = ssg.products.load_product_yaml(product_yaml_path)
-    product_dir = product_yaml.get("product_dir")
-    benchmark_root = os.path.join(product_dir, product_yaml.get("benchmark_root"))
+def get_benchmark_root(env_yaml: Dict[str, Any]) -> str:
+    """Get the benchmark root from the product data in the environment yaml."""
+    product_dir = required_key(env_yaml, "product_dir")
+    benchmark_root = os.path.join(product_dir, required_key(env_yaml, "benchmark_root"))
     return benchmark_root
 
 
@@ -6,11 +6,18 @@ import argparse
 import logging
 import os
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import ssg.environment
 
-from utils.oscal import SSG_ROOT, VENDOR_ROOT, RULES_JSON, BUILD_CONFIG, LOGGER_NAME
+from utils.oscal import (
+    SSG_ROOT,
+    VENDOR_ROOT,
+    RULES_JSON,
+    BUILD_CONFIG,
+    PROFILE_CACHE_DIR,
+    LOGGER_NAME,
+)
 from utils.oscal.control_selector import PolicyControlSelector
 from utils.oscal.cd_generator import ComponentDefinitionGenerator
 
@@ -76,10 +83,17 @@ def _parse_args() -> argparse.Namespace:
         default="service",
         help="Type of component definition to create",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Read and write resolved profile catalogs in {PROFILE_CACHE_DIR}",
+    )
     return parser.parse_args()
 
 
-def configure_logger(log_file=None, log_level=logging.INFO):
+def configure_logger(
+    log_file: Optional[str] = None, log_level: int = logging.INFO
+) -> None:
     """Configure the logger."""
     logger.setLevel(log_level)
 
@@ -112,12 +126,12 @@ def get_env_yaml(ssg_root: str, build_config_yaml: str, product: str) -> Dict[st
     return env_yaml
 
 
-def main():
+def main() -> None:
     """Main function."""
     args = _parse_args()
     configure_logger(LOG_FILE, log_level=logging.INFO)
 
-    filter_by_level = None
+    filter_by_level = ""
     if ":" in args.control:
         args.control, filter_by_level = args.control.split(":")
 
@@ -137,6 +151,7 @@ def main():
         args.vendor_dir,
         args.profile,
         control_selector,
+        profile_cache_dir=PROFILE_CACHE_DIR if args.cache else None,
     )
 
     try:
@@ -1,10 +1,17 @@
 """Build a component definition for a product from pre-existing OSCAL profiles"""
 
+import hashlib
 import logging
+import os
 import pathlib
+import pickle
 import re
+import tempfile
+import uuid
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+import trestle
 from trestle.common.common_types import TypeWithProps, TypeWithParts
 from trestle.common.const import TRESTLE_HREF_HEADING, IMPLEMENTATION_STATUS, REPLACE_ME
 from trestle.common.list_utils import as_list, none_if_empty
@@ -12,8 +19,9 @@ from trestle.core.generators import generate_sample_model
 from trestle.core.catalog.catalog_interface import CatalogInterface
 from trestle.core.control_interface import ControlInterface
 from trestle.core.profile_resolver import ProfileResolver
+from trestle.oscal import OSCAL_VERSION
 from trestle.oscal import catalog as cat
-from trestle.oscal.common import Property
+from trestle.oscal.common import Metadata, OscalVersion, Property
 from trestle.oscal.component import (
     ComponentDefinition,
     DefinedComponent,
@@ -79,16 +87,36 @@ class OscalStatus:
 class OSCALProfileHelper:
     """Helper class to handle OSCAL profile."""
 
-    def __init__(self, trestle_root: pathlib.Path) -> None:
+    def __init__(
+        self, trestle_root: pathlib.Path, cache_dir: Optional[str] = None
+    ) -> None:
         """Initialize."""
         self._root = trestle_root
+        self._cache_dir = cache_dir
         self.profile_controls: Set[str] = set()
         self.controls_by_label: Dict[str, str] = dict()
+        # Control ids and labels mapped to control ids, built once the profile is loaded
+        self._control_lookup: Dict[str, str] = dict()
 
     def load(self, profile_path: str) -> None:
         """Load the profile catalog."""
+        resolved_catalog: cat.Catalog = self._load_or_cache_catalog(profile_path)
+
+        for control in CatalogInterface(resolved_catalog).get_all_controls_from_dict():
+            self.profile_controls.add(control.id)
+            label = ControlInterface.get_label(control)
+            if label:
+                self.controls_by_label[label] = control.id
+                self._handle_parts(control)
+
+        # Labels take precedence over control ids with the same name
+        self._control_lookup = {control_id: control_id for control_id in self.profile_controls}
+        self._control_lookup.update(self.controls_by_label)
+
+    def _resolve_catalog(self, profile_path: str) -> cat.Catalog:
+        """Resolve the profile into a catalog."""
         profile_resolver = ProfileResolver()
-        resolved_catalog: cat.Catalog = profile_resolver.get_resolved_profile_catalog(
+        return profile_resolver.get_resolved_profile_catalog(
             self._root,
             profile_path,
             block_params=False,
@@ -96,41 +124,95 @@ class OSCALProfileHelper:
             show_value_warnings=True,
         )
 
-        for control in CatalogInterface(resolved_catalog).get_all_controls_from_dict():
-            self.profile_controls.add(control.id)
-            label = ControlInterface.get_label(control)
-            if label:
-                self.controls_by_label[label] = control.id
-                self._handle_parts(control)
+    def _cache_key(self, profile_path: str) -> str:
+        """
+        Get the cache key for a resolved profile.
+
+        Notes: The key covers the trestle version, the profile and the modification
+        time of every catalog and profile in the trestle workspace, so updating any
+        of them invalidates the cached catalog.
+        """
+        model_files = [os.path.abspath(profile_path)]
+        for model_dir in ("catalogs", "profiles"):
+            for dir_path, _, files in os.walk(self._root / model_dir):
+                model_files.extend(os.path.join(dir_path, file) for file in files)
+
+        key_parts = [trestle.__version__]
+        for model_file in sorted(set(model_files)):
+            key_parts.append(f"{model_file}:{os.stat(model_file).st_mtime_ns}")
+        return hashlib.sha256("\n".join(key_parts).encode("utf-8")).hexdigest()
+
+    def _load_or_cache_catalog(self, profile_path: str) -> cat.Catalog:
+        """
+        Load the resolved profile catalog from the cache or resolve and cache it.
+
+        Notes: Only local profiles are cached when a cache directory is set. A cached
+        catalog that cannot be loaded for any reason is resolved again and replaced.
+        """
+        if not self._cache_dir or not os.path.isfile(profile_path):
+            return self._resolve_catalog(profile_path)
+
+        cache_path = os.path.join(self._cache_dir, f"{self._cache_key(profile_path)}.pkl")
+        if os.path.exists(cache_path):
+            logger.debug(f"Loading resolved catalog for {profile_path} from {cache_path}")
+            try:
+                with open(cache_path, "rb") as f:
+                    return pickle.load(f)
+            except Exception as e:
+                logger.warning(
+                    f"Could not load cached catalog {cache_path}, resolving again: {e}"
+                )
+
+        resolved_catalog = self._resolve_catalog(profile_path)
+        self._write_cache(cache_path, resolved_catalog)
+        return resolved_catalog
+
+    @staticmethod
+    def _write_cache(cache_path: str, resolved_catalog: cat.Catalog) -> None:
+        """
+        Write the resolved catalog to a temporary file and move it into place.
+
+        Notes: The cache is only an optimization, so failures are logged and ignored.
+        """
+        tmp_path = None
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(resolved_catalog, f)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"Could not write cached catalog {cache_path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def _handle_parts(
         self,
         control: TypeWithParts,
     ) -> None:
         """Handle parts of a control."""
-        if control.parts:
-            for part in control.parts:
-                if not part.id:
-                    continue
-                self.profile_controls.add(part.id)
-                label = ControlInterface.get_label(part)
-                # Avoiding key collision here. The higher level control object will take
-                # precedence.
-                if label and label not in self.controls_by_label.keys():
-                    self.controls_by_label[label] = part.id
-                self._handle_parts(part)
+        # Walk the parts depth-first with an explicit stack. Children are pushed in
+        # reverse so they are visited in document order.
+        stack = list(reversed(as_list(control.parts)))
+        while stack:
+            part = stack.pop()
+            if not part.id:
+                continue
+            self.profile_controls.add(part.id)
+            label = ControlInterface.get_label(part)
+            # Avoiding key collision here. The higher level control object will take
+            # precedence.
+            if label and label not in self.controls_by_label.keys():
+                self.controls_by_label[label] = part.id
+            stack.extend(reversed(as_list(part.parts)))
 
     def validate(self, control_id: str) -> Optional[str]:
         """Validate that the control id exists in the catalog and return the id"""
-        if control_id in self.controls_by_label.keys():
-            logger.debug(f"Found control {control_id} in control labels")
-            return self.controls_by_label.get(control_id)
-        elif control_id in self.profile_controls:
-            logger.debug(f"Found control {control_id} in profile control ids")
-            return control_id
-
-        logger.debug(f"Control {control_id} does not exist in the profile")
-        return None
+        profile_control_id = self._control_lookup.get(control_id)
+        if profile_control_id is None:
+            logger.debug(f"Control {control_id} does not exist in the profile")
+        return profile_control_id
 
 
 class ComponentDefinitionGenerator:
@@ -142,8 +224,9 @@ class ComponentDefinitionGenerator:
         json_path: str,
         env_yaml: Dict[str, Any],
         vendor_dir: str,
-        profile_name_or_href,
+        profile_name_or_href: str,
         control_selector: ControlSelector,
+        profile_cache_dir: Optional[str] = None,
     ) -> None:
         """
         Initialize the component definition generator and load the necessary files.
@@ -155,6 +238,7 @@ class ComponentDefinitionGenerator:
             vendor_dir: Path to the vendor directory
             profile_name_or_href: Name or href of the profile to use
             control_selector: Control selector that contains control responses
+            profile_cache_dir: Optional directory to cache resolved profile catalogs in
         """
         self.ssg_root = root
         self.trestle_root = pathlib.Path(vendor_dir)
@@ -162,10 +246,15 @@ class ComponentDefinitionGenerator:
         self.env_yaml = env_yaml
         self.control_selector = control_selector
 
+        # Sample models are expensive to generate, so build them once and copy them
+        # with a new uuid for each requirement and statement.
+        self._implemented_req_template = generate_sample_model(ImplementedRequirement)
+        self._statement_template = generate_sample_model(Statement)
+
         profile_path, profile_href = self.get_source(profile_name_or_href)
         self.profile_href = profile_href
 
-        self.profile = OSCALProfileHelper(self.trestle_root)
+        self.profile = OSCALProfileHelper(self.trestle_root, profile_cache_dir)
         self.profile.load(profile_path)
 
         self.params_extractor = ParameterExtractor(root, self.env_yaml)
@@ -190,18 +279,20 @@ class ComponentDefinitionGenerator:
         self, control: Control
     ) -> Optional[ImplementedRequirement]:
         """Create implemented requirement from a control object"""
+        control_id = self.profile.validate(control.id)
+        if not control_id:
+            return None
 
         logger.info(f"Creating implemented requirement for {control.id}")
-        control_id = self.profile.validate(control.id)
-        if control_id:
-            implemented_req = generate_sample_model(ImplementedRequirement)
-            implemented_req.control_id = control_id
-            self.handle_response(implemented_req, control)
+        implemented_req = self._implemented_req_template.copy(
+            update={"uuid": str(uuid.uuid4())}
+        )
+        implemented_req.control_id = control_id
+        self.handle_response(implemented_req, control)
 
-            rule_ids, params_values = self._process_rule_ids(control.rules)
-            self.add_rules(implemented_req, rule_ids, params_values)
-            return implemented_req
-        return None
+        rule_ids, params_values = self._process_rule_ids(control.rules)
+        self.add_rules(implemented_req, rule_ids, params_values)
+        return implemented_req
 
     def add_rules(
         self,
@@ -233,15 +324,16 @@ class ComponentDefinitionGenerator:
         processed_rule_ids: List[str] = list()
         params_values: Dict[str, str] = dict()
         for rule_id in rule_ids:
-            parts = rule_id.split("=")
-            if len(parts) == 2:
-                param_id, value = parts
+            param_id, separator, value = rule_id.partition("=")
+            if separator:
                 params_values[param_id] = value
             else:
                 processed_rule_ids.append(rule_id)
         return (processed_rule_ids, params_values)
 
-    def handle_response(self, implemented_req, control: Control) -> None:
+    def handle_response(
+        self, implemented_req: ImplementedRequirement, control: Control
+    ) -> None:
         """
         Break down the response into parts.
 
@@ -324,9 +416,9 @@ class ComponentDefinitionGenerator:
         impl_req.props = as_list(impl_req.props)
         impl_req.props.append(status_prop)
 
-    def create_statement(self, statement_id, description="") -> Statement:
+    def create_statement(self, statement_id: str, description: str = "") -> Statement:
         """Create a statement."""
-        statement = generate_sample_model(Statement)
+        statement = self._statement_template.copy(update={"uuid": str(uuid.uuid4())})
         statement.statement_id = statement_id
         if description:
             statement.description = description
@@ -350,15 +442,20 @@ class ComponentDefinitionGenerator:
 
     def create_control_implementation(self) -> ControlImplementation:
         """Get the control implementation for a component."""
-        ci = generate_sample_model(ControlImplementation)
-        ci.source = self.profile_href
-        all_implement_reqs = list()
-
-        for control in self.control_selector.get_controls():
-            implemented_req = self.create_implemented_requirement(control)
-            if implemented_req:
-                all_implement_reqs.append(implemented_req)
-        ci.implemented_requirements = all_implement_reqs
+        implemented_reqs = (
+            self.create_implemented_requirement(control)
+            for control in self.control_selector.get_controls()
+        )
+        ci = ControlImplementation(
+            uuid=str(uuid.uuid4()),
+            source=self.profile_href,
+            description=REPLACE_ME,
+            implemented_requirements=[
+                implemented_req
+                for implemented_req in implemented_reqs
+                if implemented_req is not None
+            ],
+        )
         self.add_set_parameters(ci)
         return ci
 
@@ -367,10 +464,6 @@ class ComponentDefinitionGenerator:
     ) -> None:
         """Create a component definition and write it to a file."""
         logger.info(f"Creating component definition for {self.product}")
-        component_definition = generate_sample_model(ComponentDefinition)
-        component_definition.metadata.title = f"Component definition for {self.product}"
-        component_definition.components = list()
-
         control_implementation: ControlImplementation = (
             self.create_control_implementation()
         )
@@ -381,18 +474,28 @@ class ComponentDefinitionGenerator:
             )
             return
 
-        oscal_component = generate_sample_model(DefinedComponent)
-        oscal_component.title = self.product
-        oscal_component.type = component_definition_type
-        oscal_component.description = self.product
-        oscal_component.control_implementations = [control_implementation]
-
         # Create all of the top-level component properties for rules
         rules: List[RuleInfo] = self.rules_transformer.get_all_rules()
         all_rule_properties: List[Property] = self.rules_transformer.transform(rules)
-        oscal_component.props = none_if_empty(all_rule_properties)
 
-        component_definition.components.append(oscal_component)
+        oscal_component = DefinedComponent(
+            uuid=str(uuid.uuid4()),
+            type=component_definition_type,
+            title=self.product,
+            description=self.product,
+            props=none_if_empty(all_rule_properties),
+            control_implementations=[control_implementation],
+        )
+        component_definition = ComponentDefinition(
+            uuid=str(uuid.uuid4()),
+            metadata=Metadata(
+                title=f"Component definition for {self.product}",
+                last_modified=datetime.now().astimezone(),
+                version=REPLACE_ME,
+                oscal_version=OscalVersion(__root__=OSCAL_VERSION),
+            ),
+            components=[oscal_component],
+        )
 
         output_str = output
         out_path = pathlib.Path(output_str)
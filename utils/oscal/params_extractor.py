@@ -16,15 +16,25 @@ VAR_FILE_EXTENSION = ".var"
 
 def find_var_files(directory: str) -> Generator[str, None, None]:
     """Yield all files in a directory with a given extension."""
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(VAR_FILE_EXTENSION):
-                yield os.path.join(root, file)
+    # Skip missing or unreadable directories, as os.walk does
+    try:
+        entries = os.scandir(directory)
+    except OSError as e:
+        logger.debug(f"Skipping directory {directory}: {e}")
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from find_var_files(entry.path)
+            elif entry.name.endswith(VAR_FILE_EXTENSION):
+                yield entry.path
 
 
 class ParamInfo:
     """Stores parameter information."""
 
+    __slots__ = ("_id", "_description", "_value", "_options")
+
     def __init__(self, param_id: str, description: str) -> None:
         """Initialize."""
         self._id = param_id
@@ -69,8 +79,7 @@ class ParameterExtractor:
         self.root = root
         self.env_yaml = env_yaml
 
-        product = required_key(env_yaml, "product")
-        benchmark_root = get_benchmark_root(root, product)
+        benchmark_root = get_benchmark_root(env_yaml)
         self.param_files_for_product: Dict[str, str] = dict()
         for file in find_var_files(benchmark_root):
             param_id = os.path.basename(file).replace(VAR_FILE_EXTENSION, "")
@@ -99,15 +108,14 @@ class ParameterExtractor:
         try:
             file = self.param_files_for_product[param_id]
             value_yaml = ssg.build_yaml.Value.from_yaml(file, self.env_yaml)
-            parameter_id = os.path.basename(file).replace(VAR_FILE_EXTENSION, "")
             default = required_key(value_yaml.options, "default")
             param_obj = ParamInfo(
-                parameter_id,
+                param_id,
                 value_yaml.description.replace("\n", " ").strip(),
             )
             param_obj.set_selected_value(default)
             param_obj.set_options(value_yaml.options)
-            logger.info(f"Adding parameter {parameter_id}")
+            logger.info(f"Adding parameter {param_id}")
             return param_obj
         except KeyError as e:
             raise ValueError(f"Could not find parameter {param_id}: {e}")
@@ -1,10 +1,10 @@
 """Transform rules from existing Compliance as Code locations into OSCAL properties."""
 
-import json
 import logging
 import re
 from typing import Any, List, Dict, Optional
 
+import orjson
 from lxml import etree
 from trestle.oscal.common import Property
 from trestle.tasks.csv_to_oscal_cd import (
@@ -30,11 +30,15 @@ logger = logging.getLogger(LOGGER_NAME)
 
 
 XCCDF_VARIABLE = "xccdf_variable"
+# Newlines and runs of spaces are collapsed to a single space in rule descriptions
+DESCRIPTION_WHITESPACE = re.compile(r"[\n ]+")
 
 
 class RuleInfo:
     """Stores rule information."""
 
+    __slots__ = ("_id", "_description", "_rule_dir", "_parameters")
+
     def __init__(self, rule_id: str, rule_dir: str) -> None:
         """Initialize."""
         self._id = rule_id
@@ -82,23 +86,31 @@ class RulesTransformer:
         param_extractor: ParameterExtractor,
     ) -> None:
         """Initialize."""
-        with open(rule_dirs_json_path, "r") as f:
-            rule_dir_json = json.load(f)
+        with open(rule_dirs_json_path, "rb") as f:
+            rule_dir_json = orjson.loads(f.read())
         self.rule_json = rule_dir_json
         self.root = root
         self.env_yaml = env_yaml
         self.product = required_key(env_yaml, "product")
         self.param_extractor = param_extractor
 
-        benchmark_root = get_benchmark_root(root, self.product)
-        self.rules_dirs_for_product: Dict[str, str] = dict()
-        for dir_path in ssg.rules.find_rule_dirs_in_paths([benchmark_root]):
-            rule_id = ssg.rules.get_rule_dir_id(dir_path)
-            self.rules_dirs_for_product[rule_id] = dir_path
+        # Only walk the product benchmark root if a rule is missing from the rules json
+        self._rules_dirs_for_product: Optional[Dict[str, str]] = None
 
         # Store loaded rules here
         self._rules_by_id: Dict[str, RuleInfo] = dict()
 
+    @property
+    def rules_dirs_for_product(self) -> Dict[str, str]:
+        """Get the rule directories in the product benchmark root by rule id."""
+        if self._rules_dirs_for_product is None:
+            benchmark_root = get_benchmark_root(self.env_yaml)
+            self._rules_dirs_for_product = dict()
+            for dir_path in ssg.rules.find_rule_dirs_in_paths([benchmark_root]):
+                rule_id = ssg.rules.get_rule_dir_id(dir_path)
+                self._rules_dirs_for_product[rule_id] = dir_path
+        return self._rules_dirs_for_product
+
     def add_rules(
         self, rules: List[str], params_values: Optional[Dict[str, str]] = None
     ) -> None:
@@ -162,8 +174,6 @@ class RulesTransformer:
 
     def _from_product_dir(self, rule_id: str) -> Optional[str]:
         """Locate the rule dir in the product directory."""
-        if rule_id not in self.rules_dirs_for_product:
-            return None
         return self.rules_dirs_for_product.get(rule_id)
 
     def _load_rule_yaml(
@@ -189,9 +199,7 @@ class RulesTransformer:
         parser = etree.HTMLParser()
         tree = etree.fromstring(description, parser)  # type: ignore
         cleaned_description = etree.tostring(tree, encoding="unicode", method="text")
-        cleaned_description = cleaned_description.replace("\n", " ").strip()
-        cleaned_description = re.sub(" +", " ", cleaned_description)
-        return cleaned_description
+        return DESCRIPTION_WHITESPACE.sub(" ", cleaned_description).strip()
 
     def _get_params_ids(
         self,
@@ -251,11 +259,11 @@ class RulesTransformer:
         description_prop = add_prop(
             PARAMETER_DESCRIPTION, param_info.description, ruleset
         )
-        alternative_prop = add_prop(
-            PARAMETER_VALUE_ALTERNATIVES,
-            str(param_info.options),
-            ruleset,
-        )
+        # Serialize as JSON with sorted keys, so the value is stable across runs
+        options = orjson.dumps(
+            param_info.options, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+        alternative_prop = add_prop(PARAMETER_VALUE_ALTERNATIVES, options, ruleset)
         return [id_prop, description_prop, alternative_prop]
 
     def get_rule_id_props(self, rule_ids: List[str]) -> List[Property]:
@@ -280,10 +288,11 @@ class RulesTransformer:
     def transform(self, rule_objs: List[RuleInfo]) -> List[Property]:
         """Get the rules properties for a set of rule ids."""
         rule_properties: List[Property] = list()
+        if not rule_objs:
+            return rule_properties
 
-        start_val = -1
-        for i, rule_obj in enumerate(rule_objs):
-            rule_set_mgr = _RuleSetIdMgr(start_val + i, len(rule_objs))
+        rule_set_mgr = _RuleSetIdMgr(-1, len(rule_objs))
+        for rule_obj in rule_objs:
             rule_set_props = self._get_rule_properties(
                 rule_set_mgr.get_next_rule_set_id(), rule_obj
             )